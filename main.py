@@ -10,7 +10,7 @@ import argparse
 from pathlib import Path
 import sys
 
-from synth.config import ConfigError, load_config
+from synth.config import STDIN_CONFIG, ConfigError, load_config
 from synth.dryrun import build_entries, render_dryrun_report
 from synth.engine import EngineError, compute_timestamps
 from synth.repo import GitRepositoryError, load_commit_history
@@ -39,7 +39,7 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--config",
         required=True,
-        help="Path to rewrite policy YAML",
+        help="Path to rewrite policy YAML, or - to read it from stdin",
     )
     parser.add_argument(
         "--schema",
@@ -61,15 +61,29 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# argparse parsers are reusable across parse_args calls, so build it once at import.
+_PARSER = _build_parser()
+
+
 def main(argv: list[str] | None = None) -> int:
-    args = _build_parser().parse_args(argv)
+    args = _PARSER.parse_args(argv)
+
+    if not args.dry_run:
+        print(
+            "error: rewrite mode is not implemented yet. Use --dry-run.",
+            file=sys.stderr,
+        )
+        return 2
 
     if int(args.hash_len) <= 0:
         print("error: --hash-len must be a positive integer", file=sys.stderr)
         return 2
 
     repo_path = Path(args.repo).expanduser().resolve()
-    config_path = Path(args.config).expanduser().resolve()
+    if args.config == STDIN_CONFIG:
+        config_path = Path(STDIN_CONFIG)
+    else:
+        config_path = Path(args.config).expanduser().resolve()
     schema_path = Path(args.schema).expanduser().resolve()
 
     try:
@@ -77,16 +91,11 @@ def main(argv: list[str] | None = None) -> int:
         validated = validate_config(cfg)
 
         commits = load_commit_history(repo_path)
-        selected_commits, _untouched = apply_scope(commits, cfg.scope.fraction)
-
-        if not args.dry_run:
-            print(
-                "error: rewrite mode is not implemented yet. Use --dry-run.",
-                file=sys.stderr,
-            )
-            return 2
+        selected_commits, _untouched = apply_scope(
+            commits, cfg.scope.fraction, want_untouched=False
+        )
 
-        final = compute_timestamps(selected_commits, validated) if selected_commits else {}
+        final = compute_timestamps(selected_commits, validated) if selected_commits else []
         entries = build_entries(selected_commits, final, hash_len=int(args.hash_len))
 
         report = render_dryrun_report(
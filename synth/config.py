@@ -14,30 +14,37 @@ This module does NOT:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 import math
+import sys
 
 import json
-import yaml
-from jsonschema import Draft202012Validator
+
+# yaml and the JSON Schema backend are imported on first use rather than at module
+# load, so CLI paths that never read a config (--help, argument errors) stay fast.
+
+
+# Passing this as the config path reads the policy YAML from standard input.
+STDIN_CONFIG = "-"
 
 
 class ConfigError(RuntimeError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimestampConfig:
     mode: str  # author | commit | synthetic
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScopeConfig:
     fraction: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     timestamp: TimestampConfig
     scope: ScopeConfig
@@ -66,37 +73,120 @@ def _load_schema(schema_path: Path) -> Dict[str, Any]:
     return parsed
 
 
+@lru_cache(maxsize=None)
+def _yaml_loader() -> Any:
+    """
+    Return the LibYAML-backed safe loader when available, else the pure Python one.
+
+    Both have the same semantics as yaml.safe_load.
+    """
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
+
+
+@lru_cache(maxsize=None)
+def _validator_backend() -> Tuple[Any, str]:
+    """
+    Return (Draft202012Validator class, error path attribute name).
+
+    Prefers the Rust-backed jsonschema_rs, which reports error locations as
+    instance_path, and falls back to jsonschema, which uses path.
+    """
+    try:
+        from jsonschema_rs import Draft202012Validator
+        return Draft202012Validator, "instance_path"
+    except ImportError:
+        from jsonschema import Draft202012Validator
+        return Draft202012Validator, "path"
+
+
+@lru_cache(maxsize=8)
+def _compiled_validator(schema_path: str, mtime_ns: int) -> Any:
+    """
+    Load and compile the schema once per (path, mtime) pair.
+
+    mtime_ns is part of the cache key only, so editing schema.json invalidates the entry.
+    """
+    validator_cls, _ = _validator_backend()
+    return validator_cls(_load_schema(Path(schema_path)))
+
+
+def _error_path(err: Any) -> list:
+    return list(getattr(err, _validator_backend()[1]))
+
+
 def _load_yaml(config_path: Path) -> Dict[str, Any]:
+    import yaml
+
+    from_stdin = str(config_path) == STDIN_CONFIG
+    source = "<stdin>" if from_stdin else config_path
+
     try:
-        raw = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        if from_stdin:
+            text = sys.stdin.buffer.read().decode("utf-8")
+        else:
+            text = config_path.read_text(encoding="utf-8")
+        raw = yaml.load(text, Loader=_yaml_loader())
     except Exception as e:
-        raise ConfigError(f"Failed to load config: {config_path}") from e
+        raise ConfigError(f"Failed to load config: {source}") from e
 
     if raw is None:
-        raise ConfigError(f"Config is empty: {config_path}")
+        raise ConfigError(f"Config is empty: {source}")
 
     if not isinstance(raw, dict):
-        raise ConfigError(f"Config must be a mapping at top level: {config_path}")
+        raise ConfigError(f"Config must be a mapping at top level: {source}")
 
     return raw
 
 
-def load_config(config_path: Path, schema_path: Path) -> Config:
+def build_validator(schema_path: Path) -> Any:
+    """
+    Build a Draft 2020-12 validator for schema_path.
+
+    The result can be passed to load_config(validator=...) to validate many configs
+    against one compiled schema. Repeat calls for an unchanged file return the same
+    cached validator.
+
+    Raises ConfigError if the schema cannot be read or parsed.
+    """
+    try:
+        mtime_ns = schema_path.stat().st_mtime_ns
+    except OSError as e:
+        raise ConfigError(f"Failed to read schema file: {schema_path}") from e
+
+    return _compiled_validator(str(schema_path), mtime_ns)
+
+
+def load_config(
+    config_path: Path,
+    schema_path: Path | None = None,
+    *,
+    validator: Any = None,
+) -> Config:
     """
     Load and validate configuration.
 
+    Either schema_path or a prebuilt validator from build_validator must be given.
+    When validator is provided, schema_path is ignored.
+
     Raises ConfigError on validation failure.
     """
+    if validator is None:
+        if schema_path is None:
+            raise ConfigError("load_config requires schema_path or validator")
+        validator = build_validator(schema_path)
+
     raw_config = _load_yaml(config_path)
-    schema = _load_schema(schema_path)
 
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(raw_config), key=lambda e: list(e.path))
+    errors = sorted(validator.iter_errors(raw_config), key=_error_path)
 
     if errors:
         messages = []
         for err in errors:
-            path = ".".join(str(p) for p in err.path)
+            path = ".".join(str(p) for p in _error_path(err))
             prefix = path if path else "<root>"
             messages.append(f"{prefix}: {err.message}")
         raise ConfigError("Invalid configuration:\n" + "\n".join(messages))
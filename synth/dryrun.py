@@ -16,12 +16,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Mapping, Sequence
+from typing import List, Optional, Sequence
 
 from synth.repo import Commit
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DryRunEntry:
     index: int
     hash_prefix: str
@@ -30,41 +30,57 @@ class DryRunEntry:
     final_timestamp: datetime
     changed: bool
 
+    # True when final_timestamp is the same object as author_date / committer_date,
+    # as in author and commit modes. Lets the renderer reuse the formatted value.
+    final_is_author: bool = False
+    final_is_committer: bool = False
+
 
 def build_entries(
     commits: Sequence[Commit],
-    final_timestamps: Mapping[str, datetime],
+    final_timestamps: Sequence[datetime],
     *,
     hash_len: int = 12,
 ) -> List[DryRunEntry]:
     """
     Build per commit dry run entries.
 
+    Entries are returned in the order of commits. load_commit_history and apply_scope
+    produce commits oldest -> newest, so no further sorting is needed.
+
+    final_timestamps is aligned by position with commits, as returned by compute_timestamps.
+
     Raises:
-        KeyError: if a commit hash is missing from final_timestamps, this indicates an upstream bug.
-        ValueError: if hash_len is invalid.
+        ValueError: if hash_len is invalid, or if final_timestamps is not aligned with
+            commits, which indicates an upstream bug.
     """
     if hash_len <= 0:
         raise ValueError("hash_len must be a positive integer")
 
+    if len(final_timestamps) != len(commits):
+        raise ValueError("final_timestamps must have one entry per commit")
+
     entries: List[DryRunEntry] = []
+    append = entries.append
 
-    for c in commits:
-        final = final_timestamps[c.hash]
-        changed = (c.author_date != final) or (c.committer_date != final)
+    for c, final in zip(commits, final_timestamps):
+        commit_hash = c.hash
+        author_date = c.author_date
+        committer_date = c.committer_date
 
-        entries.append(
+        append(
             DryRunEntry(
                 index=c.index,
-                hash_prefix=c.hash[:hash_len],
-                author_date=c.author_date,
-                committer_date=c.committer_date,
+                hash_prefix=commit_hash[:hash_len],
+                author_date=author_date,
+                committer_date=committer_date,
                 final_timestamp=final,
-                changed=changed,
+                changed=(author_date != final) or (committer_date != final),
+                final_is_author=final is author_date,
+                final_is_committer=final is committer_date,
             )
         )
 
-    entries.sort(key=lambda e: e.index)
     return entries
 
 
@@ -79,6 +95,8 @@ def render_dryrun_report(
 ) -> str:
     """
     Render a dry run report as plain text.
+
+    entries must already be in index order, as returned by build_entries.
     """
     lines: List[str] = []
 
@@ -111,20 +129,37 @@ def render_dryrun_report(
         "changed",
     ]
 
+    # Column widths are tracked while rows are built, so the table is not rescanned.
+    widths = [len(h) for h in headers]
+
     rows: List[List[str]] = []
-    for e in sorted(entries, key=lambda x: x.index):
-        rows.append(
-            [
-                str(e.index),
-                e.hash_prefix,
-                _fmt_dt(e.author_date),
-                _fmt_dt(e.committer_date),
-                _fmt_dt(e.final_timestamp),
-                "yes" if e.changed else "no",
-            ]
-        )
+    for e in entries:
+        a = _fmt_dt(e.author_date)
+        c = _fmt_dt(e.committer_date)
+
+        if e.final_is_author:
+            f = a
+        elif e.final_is_committer:
+            f = c
+        else:
+            f = _fmt_dt(e.final_timestamp)
+
+        row = [
+            str(e.index),
+            e.hash_prefix,
+            a,
+            c,
+            f,
+            "yes" if e.changed else "no",
+        ]
 
-    lines.extend(_format_table(headers, rows))
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+        rows.append(row)
+
+    lines.extend(_format_table(headers, rows, widths))
     return "\n".join(lines)
 
 
@@ -132,21 +167,31 @@ def _fmt_dt(dt: datetime) -> str:
     return dt.isoformat()
 
 
-def _format_table(headers: List[str], rows: List[List[str]]) -> List[str]:
-    widths = [len(h) for h in headers]
+def _format_table(
+    headers: List[str],
+    rows: List[List[str]],
+    widths: Optional[List[int]] = None,
+) -> List[str]:
+    """
+    Format headers and rows as left aligned columns.
 
-    for row in rows:
-        for i, cell in enumerate(row):
-            widths[i] = max(widths[i], len(cell))
+    widths, when given, must already cover every header and cell.
+    """
+    if widths is None:
+        widths = [len(h) for h in headers]
+
+        for row in rows:
+            for i, cell in enumerate(row):
+                widths[i] = max(widths[i], len(cell))
 
-    def fmt_row(items: List[str]) -> str:
-        return "  ".join(items[i].ljust(widths[i]) for i in range(len(items)))
+    # Bake the column widths into one printf-style format, e.g. "%-3s  %-12s  ...".
+    fmt = "  ".join("%-" + str(w) + "s" for w in widths)
 
     lines: List[str] = []
-    lines.append(fmt_row(headers))
-    lines.append(fmt_row(["-" * w for w in widths]))
+    lines.append(fmt % tuple(headers))
+    lines.append(fmt % tuple("-" * w for w in widths))
 
     for row in rows:
-        lines.append(fmt_row(row))
+        lines.append(fmt % tuple(row))
 
     return lines
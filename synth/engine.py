@@ -15,18 +15,37 @@ This module does NOT:
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, time, date, tzinfo
-from typing import Dict, List, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta, time, date
+from typing import List
 import random
 
 from synth.repo import Commit
-from synth.validation import ValidatedConfig, ParsedWorkPatterns, ParsedWorkBlock, ParsedWorkHours
+from synth.validation import ValidatedConfig, ParsedWorkPatterns, ParsedWorkBlock
 
 
 class EngineError(RuntimeError):
     pass
 
 
+_SECONDS_PER_DAY = 86400
+
+
+@dataclass(frozen=True)
+class _DayWindows:
+    """
+    Per-day work windows over the calendar, indexed by days since start_day.
+
+    Bounds are wall clock seconds since start_day midnight, with -1 for disabled days.
+    The end bound is inclusive through the full minute.
+    next_enabled[d] is the first enabled day index at or after d, or -1 if none remain.
+    """
+
+    starts: List[int]
+    ends: List[int]
+    next_enabled: List[int]
+
+
 # ---------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------
@@ -34,7 +53,7 @@ class EngineError(RuntimeError):
 def compute_timestamps(
     commits: List[Commit],
     config: ValidatedConfig,
-) -> Dict[str, datetime]:
+) -> List[datetime]:
     """
     Compute final timestamps for commits.
 
@@ -43,7 +62,7 @@ def compute_timestamps(
         config: validated and parsed configuration
 
     Returns:
-        dict: commit_hash -> datetime
+        list: final datetime per commit, aligned by position with commits
     """
     mode = config.timestamp.mode
 
@@ -63,24 +82,24 @@ def compute_timestamps(
 # Mode implementations
 # ---------------------------------------------------------------------
 
-def _author_mode(commits: List[Commit]) -> Dict[str, datetime]:
+def _author_mode(commits: List[Commit]) -> List[datetime]:
     """
     Restore committer dates from author dates.
     """
-    return {c.hash: c.author_date for c in commits}
+    return [c.author_date for c in commits]
 
 
-def _commit_mode(commits: List[Commit]) -> Dict[str, datetime]:
+def _commit_mode(commits: List[Commit]) -> List[datetime]:
     """
     Restore author dates from committer dates.
     """
-    return {c.hash: c.committer_date for c in commits}
+    return [c.committer_date for c in commits]
 
 
 def _synthetic_mode(
     commits: List[Commit],
     config: ValidatedConfig,
-) -> Dict[str, datetime]:
+) -> List[datetime]:
     """
     Generate a synthetic timeline.
 
@@ -90,7 +109,7 @@ def _synthetic_mode(
     - randomness ranges are sane
     """
     if not commits:
-        return {}
+        return []
 
     if config.calendar is None or config.work_patterns is None or config.randomness is None:
         raise EngineError("Synthetic mode requires validated calendar, work_patterns, and randomness")
@@ -111,103 +130,139 @@ def _synthetic_mode(
     sec_min = int(randomness.seconds_min)
     sec_max = int(randomness.seconds_max)
 
-    day0 = _next_enabled_day(start_day, end_day, work)
-    current = _random_datetime_for_day(day0, work, rng, sec_min, sec_max, tz)
+    windows = _build_day_windows(start_day, end_day, work)
+
+    day0 = windows.next_enabled[0]
+    if day0 < 0:
+        raise EngineError("Synthetic calendar window exhausted")
 
-    results: Dict[str, datetime] = {commits[0].hash: current}
+    # The walk runs on integer wall clock seconds since start_day midnight. Datetimes
+    # are only built once, at the output boundary.
+    current = _random_offset_for_day(windows, day0, rng, sec_min, sec_max)
+    offsets: List[int] = [current]
 
-    for commit in commits[1:]:
-        candidate = current + _random_gap(rng, gap_min, gap_max, sec_min, sec_max)
-        current = _next_valid_datetime(candidate, end_day, work, rng, sec_min, sec_max, tz)
-        results[commit.hash] = current
+    # Draw every gap up front as plain integer seconds. The walk below only consumes
+    # the RNG when it has to pick a fresh time inside a work window.
+    gaps_seconds = _random_gaps_seconds(rng, len(commits) - 1, gap_min, gap_max, sec_min, sec_max)
 
-    return results
+    for gap_seconds in gaps_seconds:
+        current = _next_valid_offset(current + gap_seconds, windows, rng, sec_min, sec_max)
+        offsets.append(current)
+
+    # Aware datetime + timedelta is wall clock arithmetic, matching datetime.combine.
+    origin = datetime.combine(start_day, time(0, 0), tzinfo=tz)
+    return [origin + timedelta(seconds=offset) for offset in offsets]
 
 
 # ---------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------
 
-def _random_gap(
+def _random_gaps_seconds(
     rng: random.Random,
+    count: int,
     gap_min: int,
     gap_max: int,
     sec_min: int,
     sec_max: int,
-) -> timedelta:
-    return timedelta(
-        minutes=rng.randint(gap_min, gap_max),
-        seconds=rng.randint(sec_min, sec_max),
-    )
+) -> List[int]:
+    randint = rng.randint
+    return [randint(gap_min, gap_max) * 60 + randint(sec_min, sec_max) for _ in range(count)]
 
 
-def _next_enabled_day(
+def _build_day_windows(
     start_day: date,
     end_day: date,
     work: ParsedWorkPatterns,
-) -> date:
-    day = start_day
-    while day <= end_day:
-        block = _work_block_for_day(day, work)
-        if block.enabled:
-            return day
-        day = day + timedelta(days=1)
+) -> _DayWindows:
+    n_days = (end_day - start_day).days + 1
 
-    raise EngineError("Synthetic calendar window exhausted")
+    starts = [-1] * n_days
+    ends = [-1] * n_days
 
+    for d in range(n_days):
+        block = _work_block_for_day(start_day + timedelta(days=d), work)
+        if not block.enabled or block.hours is None:
+            continue
 
-def _next_valid_datetime(
-    candidate: datetime,
-    end_day: date,
-    work: ParsedWorkPatterns,
+        hours = block.hours
+        start_s = hours.start.hour * 3600 + hours.start.minute * 60
+        end_s = hours.end.hour * 3600 + hours.end.minute * 60 + 59
+
+        if end_s < start_s:
+            raise EngineError("Invalid work window: end before start")
+
+        base = d * _SECONDS_PER_DAY
+        starts[d] = base + start_s
+        ends[d] = base + end_s
+
+    # Right to left sweep so every day points at the next enabled day.
+    next_enabled = [-1] * n_days
+    following = -1
+    for d in range(n_days - 1, -1, -1):
+        if starts[d] >= 0:
+            following = d
+        next_enabled[d] = following
+
+    return _DayWindows(starts=starts, ends=ends, next_enabled=next_enabled)
+
+
+def _next_valid_offset(
+    candidate: int,
+    windows: _DayWindows,
     rng: random.Random,
     sec_min: int,
     sec_max: int,
-    tz: tzinfo,
-) -> datetime:
+) -> int:
     """
     Move candidate forward until it lands inside an enabled day and inside that day's work window.
 
-    This function never returns a datetime earlier than candidate.
+    candidate and the result are wall clock seconds since start_day midnight.
+    This function never returns an offset earlier than candidate.
     """
-    day = candidate.date()
-
-    while day <= end_day:
-        block = _work_block_for_day(day, work)
+    day_idx = candidate // _SECONDS_PER_DAY
 
-        if not block.enabled or block.hours is None:
-            day = day + timedelta(days=1)
-            candidate = datetime.combine(day, time(0, 0), tzinfo=tz)
-            continue
+    # At most two steps: the candidate's own day, then the next enabled day. A candidate
+    # carried onto a later day restarts at that day's midnight, so a window opening at
+    # 00:00 accepts it as is instead of drawing a random time.
+    while day_idx < len(windows.next_enabled):
+        day_idx = windows.next_enabled[day_idx]
+        if day_idx < 0:
+            break
 
-        window_start, window_end = _window_bounds(day, block.hours, tz)
+        candidate = max(candidate, day_idx * _SECONDS_PER_DAY)
 
-        if candidate < window_start:
-            return _random_datetime_for_day(day, work, rng, sec_min, sec_max, tz)
+        if candidate < windows.starts[day_idx]:
+            return _random_offset_for_day(windows, day_idx, rng, sec_min, sec_max)
 
-        if window_start <= candidate <= window_end:
+        if candidate <= windows.ends[day_idx]:
             return candidate
 
-        day = day + timedelta(days=1)
-        candidate = datetime.combine(day, time(0, 0), tzinfo=tz)
+        day_idx += 1
 
     raise EngineError("Synthetic calendar window exhausted")
 
 
-def _random_datetime_for_day(
-    day: date,
-    work: ParsedWorkPatterns,
+def _random_offset_for_day(
+    windows: _DayWindows,
+    day_idx: int,
     rng: random.Random,
     sec_min: int,
     sec_max: int,
-    tz: tzinfo,
-) -> datetime:
-    block = _work_block_for_day(day, work)
-    if not block.enabled or block.hours is None:
+) -> int:
+    """
+    Pick a uniformly random minute inside the day's window, then a second in [sec_min, sec_max].
+    """
+    window_start = windows.starts[day_idx]
+    if window_start < 0:
         raise EngineError("Internal error: requested random time for a disabled day")
 
-    t = _pick_time_in_window(rng, (block.hours.start, block.hours.end), sec_min, sec_max)
-    return datetime.combine(day, t, tzinfo=tz)
+    # ends is inclusive through the full minute, so drop the trailing 59 seconds.
+    minutes = (windows.ends[day_idx] - 59 - window_start) // 60
+
+    chosen_m = rng.randrange(0, minutes + 1)
+    chosen_second = rng.randint(sec_min, sec_max)
+    return window_start + chosen_m * 60 + chosen_second
 
 
 def _work_block_for_day(day: date, work: ParsedWorkPatterns) -> ParsedWorkBlock:
@@ -220,38 +275,3 @@ def _work_block_for_day(day: date, work: ParsedWorkPatterns) -> ParsedWorkBlock:
         return work.saturday
 
     return work.sunday
-
-
-def _window_bounds(day: date, hours: ParsedWorkHours, tz: tzinfo) -> Tuple[datetime, datetime]:
-    """
-    Work hours are minute based (HH:MM). Treat end as inclusive through the full minute.
-    """
-    start_dt = datetime.combine(day, time(hours.start.hour, hours.start.minute, 0), tzinfo=tz)
-    end_dt = datetime.combine(day, time(hours.end.hour, hours.end.minute, 59), tzinfo=tz)
-    return start_dt, end_dt
-
-
-def _pick_time_in_window(
-    rng: random.Random,
-    window: Tuple[time, time],
-    sec_min: int,
-    sec_max: int,
-) -> time:
-    start, end = window
-
-    # Minute based window, end is inclusive through the full minute.
-    start_s = start.hour * 3600 + start.minute * 60
-    end_s = end.hour * 3600 + end.minute * 60 + 59
-
-    if end_s < start_s:
-        raise EngineError("Invalid work window: end before start")
-
-    chosen_s = rng.randint(start_s, end_s)
-    chosen_s = chosen_s - (chosen_s % 60)  # align to minute boundary
-    chosen_s = max(start_s, min(chosen_s, end_s))
-
-    chosen_minute = (chosen_s % 3600) // 60
-    chosen_hour = chosen_s // 3600
-
-    chosen_second = rng.randint(sec_min, sec_max)
-    return time(int(chosen_hour), int(chosen_minute), int(chosen_second))
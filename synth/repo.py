@@ -11,18 +11,34 @@ UI support:
 """
 
 from dataclasses import dataclass
-from datetime import datetime
-from subprocess import run, PIPE, CalledProcessError
-from typing import List
+from datetime import datetime, timedelta, timezone
+from subprocess import Popen, run, PIPE, CalledProcessError
+from typing import IO, Callable, Dict, Iterator, List, Tuple
 from pathlib import Path
 import os
+import tempfile
 
 
-# Single source of truth for git field separation
-_FIELD_SEP = "\x00"
+# Single source of truth for git field and record separation.
+# Fields use ASCII unit separator; records are NUL terminated via `git log -z`.
+_FIELD_SEP = "\x1f"
+_RECORD_SEP = b"\x00"
 
+_STREAM_CHUNK_SIZE = 64 * 1024
 
-@dataclass(frozen=True)
+# Opt-in (load_commit_history(..., reuse_cached=True)) cache for long-lived callers that
+# reload the same history. Commit hash -> (staleness key, Commit). A hash pins the commit
+# object, so in practice only the decorations and log position can change under it; the
+# dates are included as well so replace refs cannot serve a stale Commit. Bounded, with
+# the oldest entries evicted first.
+_COMMIT_CACHE_MAX = 100_000
+_commit_cache: Dict[str, Tuple[Tuple[str, str, str, int], "Commit"]] = {}
+
+# "+HH:MM" / "-HH:MM" suffix -> tzinfo. Most histories use a handful of offsets.
+_TZ_CACHE: Dict[str, timezone] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class Commit:
     hash: str
     author_date: datetime
@@ -80,6 +96,160 @@ def _run_git_command(repo_path: Path, args: List[str]) -> str:
         raise GitRepositoryError(stderr if stderr else "git command failed") from e
 
 
+def _run_git_command_stream(repo_path: Path, args: List[str], stderr: IO[bytes]) -> Popen:
+    """
+    Start a git command and return the process with binary stdout open for streaming.
+
+    stderr goes to the given file rather than a pipe, so git can never block on a
+    full stderr pipe while the caller is still draining stdout. The caller is
+    responsible for draining stdout, reading stderr back after the process exits and
+    checking the return code.
+    """
+    repo_path = _normalise_repo_path(repo_path)
+
+    return Popen(
+        ["git", "-C", str(repo_path)] + args,
+        stdout=PIPE,
+        stderr=stderr,
+    )
+
+
+def _iter_records(stream: IO[bytes]) -> Iterator[str]:
+    """
+    Yield decoded records from a binary stream separated by _RECORD_SEP.
+
+    Empty records (for example a trailing separator) are skipped.
+    """
+    pending = b""
+
+    while True:
+        chunk = stream.read(_STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+
+        # Walk the buffer with find() rather than split() so no per-chunk list of
+        # records is materialised.
+        buf = pending + chunk
+        pos = 0
+        while True:
+            end = buf.find(_RECORD_SEP, pos)
+            if end < 0:
+                break
+            if end > pos:
+                yield buf[pos:end].decode("utf-8", "replace")
+            pos = end + 1
+
+        pending = buf[pos:]
+
+    if pending:
+        yield pending.decode("utf-8", "replace")
+
+
+def _parse_iso_strict(value: str) -> datetime:
+    """
+    Parse git's --date=iso-strict output (YYYY-MM-DDTHH:MM:SS+HH:MM) by slicing.
+
+    Any other shape, for example a "Z" suffix, falls back to datetime.fromisoformat.
+    Raises ValueError on malformed input.
+    """
+    if len(value) != 25 or value[10] != "T" or value[19] not in "+-":
+        return datetime.fromisoformat(value)
+
+    suffix = value[19:]
+    tz = _TZ_CACHE.get(suffix)
+    if tz is None:
+        offset = timedelta(hours=int(suffix[1:3]), minutes=int(suffix[4:6]))
+        tz = timezone(-offset if suffix[0] == "-" else offset)
+        _TZ_CACHE[suffix] = tz
+
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        tzinfo=tz,
+    )
+
+
+def _parse_commit(record: str, idx: int, intern: Callable[[str], str]) -> Commit:
+    parts = record.split(_FIELD_SEP)
+
+    if len(parts) != 9:
+        raise GitRepositoryError(f"Malformed git log record: {record!r}")
+
+    (
+        commit_hash,
+        author_str,
+        committer_str,
+        author_name,
+        author_email,
+        committer_name,
+        committer_email,
+        subject,
+        refs,
+    ) = parts
+
+    try:
+        author_date = _parse_iso_strict(author_str)
+        committer_date = _parse_iso_strict(committer_str)
+    except ValueError as e:
+        raise GitRepositoryError(
+            f"Invalid timestamp format in git log: {record!r}"
+        ) from e
+
+    return Commit(
+        hash=commit_hash,
+        author_date=author_date,
+        committer_date=committer_date,
+        index=idx,
+        subject=subject,
+        author_name=intern(author_name),
+        author_email=intern(author_email),
+        committer_name=intern(committer_name),
+        committer_email=intern(committer_email),
+        refs=intern(refs.strip()),
+    )
+
+
+def _get_commit(record: str, idx: int, intern: Callable[[str], str]) -> Commit:
+    """
+    Return the Commit for a git log record, reusing the instance from an earlier load
+    when its dates, decorations and index are unchanged.
+
+    intern maps equal identity strings to one shared instance.
+    """
+    parts = record.split(_FIELD_SEP)
+    if len(parts) != 9:
+        raise GitRepositoryError(f"Malformed git log record: {record!r}")
+
+    commit_hash = parts[0]
+    key = (parts[1], parts[2], parts[8], idx)
+
+    cached = _commit_cache.pop(commit_hash, None)
+    if cached is not None and cached[0] == key:
+        commit = cached[1]
+    else:
+        commit = _parse_commit(record, idx, intern)
+        key = (intern(parts[1]), intern(parts[2]), intern(parts[8]), idx)
+
+    # Re-inserting moves the entry to the young end, so eviction drops the least
+    # recently loaded commits.
+    _commit_cache[commit_hash] = (key, commit)
+    if len(_commit_cache) > _COMMIT_CACHE_MAX:
+        del _commit_cache[next(iter(_commit_cache))]
+
+    return commit
+
+
+def clear_commit_cache() -> None:
+    """
+    Drop all cached Commit instances. Intended for tests and long-lived processes.
+    """
+    _commit_cache.clear()
+
+
 def ensure_git_repository(repo_path: Path) -> None:
     try:
         _run_git_command(repo_path, ["rev-parse", "--is-inside-work-tree"])
@@ -87,10 +257,14 @@ def ensure_git_repository(repo_path: Path) -> None:
         raise GitRepositoryError(f"Not a git repository: {repo_path}") from e
 
 
-def load_commit_history(repo_path: Path) -> List[Commit]:
+def load_commit_history(repo_path: Path, *, reuse_cached: bool = False) -> List[Commit]:
     """
     Load commits in deterministic oldest → newest order.
 
+    With reuse_cached, Commit instances from earlier loads in this process are reused
+    for unchanged commits. Off by default: a one-shot CLI load never hits the cache and
+    would only keep memory alive.
+
     Fields per commit:
     - hash
     - author_date, committer_date
@@ -98,74 +272,53 @@ def load_commit_history(repo_path: Path) -> List[Commit]:
     - subject (first line of message)
     - refs (decorations from %D)
     """
-    ensure_git_repository(repo_path)
-
     log_format = (
-    "%H%x00"
-    "%ad%x00"
-    "%cd%x00"
-    "%an%x00"
-    "%ae%x00"
-    "%cn%x00"
-    "%ce%x00"
-    "%s%x00"
+    "%H%x1f"
+    "%ad%x1f"
+    "%cd%x1f"
+    "%an%x1f"
+    "%ae%x1f"
+    "%cn%x1f"
+    "%ce%x1f"
+    "%s%x1f"
     "%D"
     )
 
-    raw_log = _run_git_command(
-        repo_path,
-        [
-            "log",
-            "--reverse",
-            "--date=iso-strict",
-            f"--pretty=format:{log_format}",
-        ],
-    )
-
     commits: List[Commit] = []
 
-    if not raw_log:
-        return commits
-
-    for idx, line in enumerate(raw_log.splitlines()):
-        parts = line.split(_FIELD_SEP)
-
-        if len(parts) != 9:
-            raise GitRepositoryError(f"Malformed git log line: {line!r}")
-
-        (
-            commit_hash,
-            author_str,
-            committer_str,
-            author_name,
-            author_email,
-            committer_name,
-            committer_email,
-            subject,
-            refs,
-        ) = parts
-
-        try:
-            author_date = datetime.fromisoformat(author_str)
-            committer_date = datetime.fromisoformat(committer_str)
-        except ValueError as e:
-            raise GitRepositoryError(
-                f"Invalid timestamp format in git log: {line!r}"
-            ) from e
-
-        commits.append(
-            Commit(
-                hash=commit_hash,
-                author_date=author_date,
-                committer_date=committer_date,
-                index=idx,
-                subject=subject,
-                author_name=author_name,
-                author_email=author_email,
-                committer_name=committer_name,
-                committer_email=committer_email,
-                refs=refs.strip(),
-            )
-        )
+    # Histories have few distinct authors, committers and decorations; share one
+    # string instance per distinct value instead of one per commit.
+    intern_cache: Dict[str, str] = {}
+
+    def _intern(value: str) -> str:
+        return intern_cache.setdefault(value, value)
+
+    # Stream NUL separated records so commits are parsed while git is still producing
+    # output, rather than buffering the whole history as one string first.
+    with tempfile.TemporaryFile() as err_file:
+        with _run_git_command_stream(
+            repo_path,
+            [
+                "log",
+                "-z",
+                "--reverse",
+                "--date=iso-strict",
+                f"--pretty=format:{log_format}",
+            ],
+            err_file,
+        ) as proc:
+            get_commit = _get_commit if reuse_cached else _parse_commit
+            for idx, record in enumerate(_iter_records(proc.stdout)):
+                commits.append(get_commit(record, idx, _intern))
+
+        # Leaving the Popen block waited for git, so stderr is complete.
+        err_file.seek(0)
+        stderr = err_file.read().decode("utf-8", "replace").strip()
+
+    if proc.returncode != 0:
+        # Only pay for the rev-parse probe on failure, to report a non-repository
+        # path clearly. The happy path spawns a single git process.
+        ensure_git_repository(repo_path)
+        raise GitRepositoryError(stderr if stderr else "git command failed")
 
     return commits
@@ -18,20 +18,21 @@ This module does NOT:
 from __future__ import annotations
 
 import argparse
-import json
+import importlib.util
+import marshal
 import sys
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from subprocess import CalledProcessError, run, PIPE
-from typing import Dict, List, Mapping, Optional
+from typing import Dict, List, Optional, Sequence
 
-from synth.config import ConfigError, load_config
+from synth.config import STDIN_CONFIG, ConfigError, load_config
 from synth.engine import EngineError, compute_timestamps
-from synth.repo import GitRepositoryError, load_commit_history
+from synth.repo import Commit, GitRepositoryError, load_commit_history
 from synth.scope import ScopeError, apply_scope
-from synth.validation import ValidationError, validate_config
+from synth.validation import ValidatedConfig, ValidationError, validate_config
 from synth.dryrun import build_entries, render_dryrun_report
 
 
@@ -46,7 +47,10 @@ class RewritePlan:
     total_commits: int
     mode: str
     scope_fraction: float
-    date_map: Mapping[str, str]  # original commit hash (lower) -> "unix_seconds +/-HHMM"
+    date_map: Dict[bytes, bytes]  # original commit hash (lower, ascii) -> b"unix_seconds +/-HHMM"
+    validated: ValidatedConfig  # reused for the post-rewrite report
+    selected: Sequence[Commit]  # commits selected by scope, oldest -> newest
+    final: Sequence[datetime]  # final timestamp per selected commit, aligned by position
 
 
 def _default_schema_path() -> str:
@@ -57,6 +61,23 @@ def _default_schema_path() -> str:
     return str((Path(__file__).resolve().parents[1] / "schema.json"))
 
 
+# Resolved once at import; the parser default and callers reuse it.
+_DEFAULT_SCHEMA_PATH = _default_schema_path()
+
+
+def _fast_resolve(path: Path) -> Path:
+    """
+    Expand "~" and make the path absolute, touching the filesystem only when needed.
+
+    Absolute paths are returned as-is rather than passed through Path.resolve(), which
+    walks every component with stat/readlink calls.
+    """
+    path = path.expanduser()
+    if path.is_absolute():
+        return path
+    return path.resolve()
+
+
 def _run_git(repo_path: Path, args: List[str]) -> str:
     try:
         result = run(
@@ -81,35 +102,56 @@ def _ensure_clean_worktree(repo_path: Path) -> None:
 
 
 def _ensure_filter_repo_available(repo_path: Path) -> None:
-    try:
-        run(
-            [sys.executable, "-m", "git_filter_repo", "--help"],
-            stdout=PIPE,
-            stderr=PIPE,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=True,
-        )
-    except CalledProcessError as e:
-        stderr = (e.stderr or "").strip()
+    # A presence check only: git-filter-repo is later run as
+    # `sys.executable -m git_filter_repo`, so importability from this
+    # interpreter is exactly what matters.
+    if importlib.util.find_spec("git_filter_repo") is None:
         raise RewriteError(
             "git-filter-repo is not available. Install it in the active environment, then try again."
-        ) from e
+        )
 
 
-def _format_git_date(dt: datetime) -> str:
+def _format_git_dates(dts: Sequence[datetime]) -> List[str]:
     """
-    Convert a timezone-aware datetime to git-filter-repo's expected date bytes format:
+    Convert timezone-aware datetimes to git-filter-repo's expected date bytes format:
     "<unix_seconds> <+HHMM or -HHMM>"
 
     Validation and engine should provide timezone-aware datetimes. If tzinfo is missing,
     treat the value as UTC to avoid undefined behaviour.
+
+    The "+HHMM" suffix is formatted once per distinct UTC offset rather than once per
+    datetime; a rewrite usually involves only one or two offsets. When every datetime
+    carries the same fixed-offset tzinfo, the suffix is computed once up front and
+    utcoffset() is not called per datetime at all.
     """
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+    if not dts:
+        return []
+
+    tz = dts[0].tzinfo
+    if isinstance(tz, timezone) and all(dt.tzinfo is tz for dt in dts):
+        suffix = _format_utc_offset(tz.utcoffset(None))
+        return [f"{int(dt.timestamp())} {suffix}" for dt in dts]
+
+    suffixes: Dict[Optional[timedelta], str] = {}
+    out: List[str] = []
+    append = out.append
+    utc = timezone.utc
+
+    for dt in dts:
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=utc)
+
+        offset = dt.utcoffset()
+        suffix = suffixes.get(offset)
+        if suffix is None:
+            suffix = suffixes[offset] = _format_utc_offset(offset)
+
+        append(f"{int(dt.timestamp())} {suffix}")
+
+    return out
+
 
-    offset = dt.utcoffset()
+def _format_utc_offset(offset: Optional[timedelta]) -> str:
     if offset is None:
         offset = timedelta(0)
 
@@ -120,8 +162,7 @@ def _format_git_date(dt: datetime) -> str:
     hh = total_minutes // 60
     mm = total_minutes % 60
 
-    ts = int(dt.timestamp())
-    return f"{ts} {sign}{hh:02d}{mm:02d}"
+    return f"{sign}{hh:02d}{mm:02d}"
 
 
 def _build_rewrite_plan(
@@ -133,15 +174,21 @@ def _build_rewrite_plan(
     validated = validate_config(cfg)
 
     commits = load_commit_history(repo_path)
-    selected, _untouched = apply_scope(commits, cfg.scope.fraction)
+    selected, _untouched = apply_scope(commits, cfg.scope.fraction, want_untouched=False)
 
-    final = compute_timestamps(selected, validated) if selected else {}
+    final = compute_timestamps(selected, validated) if selected else []
 
-    date_map: Dict[str, str] = {}
-    for c in selected:
-        if c.hash not in final:
-            raise RewriteError(f"Missing computed timestamp for commit: {c.hash}")
-        date_map[c.hash.lower()] = _format_git_date(final[c.hash])
+    if len(final) != len(selected):
+        raise RewriteError(
+            f"Computed {len(final)} timestamps for {len(selected)} selected commits"
+        )
+
+    # Keys and values are stored as ASCII bytes, the form git-filter-repo uses, so the
+    # commit callback does no per-commit conversion. Both columns are built as flat
+    # lists first and paired up in a single dict(zip(...)) call.
+    hashes = [c.hash.lower().encode("ascii") for c in selected]
+    dates = [d.encode("ascii") for d in _format_git_dates(final)]
+    date_map: Dict[bytes, bytes] = dict(zip(hashes, dates))
 
     return RewritePlan(
         repo_path=repo_path,
@@ -150,6 +197,9 @@ def _build_rewrite_plan(
         mode=cfg.timestamp.mode,
         scope_fraction=cfg.scope.fraction,
         date_map=date_map,
+        validated=validated,
+        selected=selected,
+        final=final,
     )
 
 
@@ -160,28 +210,71 @@ def _commit_callback_body(mapping_path: Path) -> str:
     Note: git-filter-repo uses bytestrings for commit fields.
     - commit.original_id is a bytestring of the original hash
     - commit.author_date and commit.committer_date are bytestrings like b"unix +0000"
+
+    The body runs inside a function filter-repo defines per callback, so the map's
+    bound .get is kept in a callback global and loaded on the first commit only: the
+    NameError raised by that first lookup is the load trigger, and later commits pay
+    for a single global lookup and call. The map is a marshal file of lowercase hash
+    bytes -> date bytes, written by the same interpreter; git emits object ids in
+    lowercase, so original_id is used as the key directly.
     """
     map_path = mapping_path.as_posix()
 
     return f"""
-if 'DATE_MAP' not in globals():
-    import json
-    with open({map_path!r}, 'r', encoding='utf-8') as _f:
-        DATE_MAP = json.load(_f)
+global _get_date
+try:
+    _new = _get_date(commit.original_id)
+except NameError:
+    import marshal
+    with open({map_path!r}, 'rb') as _f:
+        _get_date = marshal.load(_f).get
+    _new = _get_date(commit.original_id)
 
-_oid = commit.original_id
-if isinstance(_oid, bytes):
-    _oid = _oid.decode('ascii', 'ignore')
-_oid = _oid.lower()
-
-_new = DATE_MAP.get(_oid)
 if _new is not None:
-    _b = _new.encode('ascii')
-    commit.author_date = _b
-    commit.committer_date = _b
+    commit.author_date = _new
+    commit.committer_date = _new
 """.strip()
 
 
+def _read_commit_map(repo_path: Path) -> Optional[Dict[str, str]]:
+    """
+    Read the old -> new commit hash map git-filter-repo writes after a run.
+
+    Returns None if the file is missing or unreadable.
+    """
+    map_path = repo_path / ".git" / "filter-repo" / "commit-map"
+
+    try:
+        with open(map_path, "r", encoding="ascii") as f:
+            f.readline()  # header: "old new"
+            return dict(line.split() for line in f if line.strip())
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+
+
+def _planned_final_state(plan: RewritePlan) -> Optional[List[Commit]]:
+    """
+    Derive the rewritten selected commits from plan state and git-filter-repo's commit map,
+    without reading the history back from git.
+
+    Rewriting dates changes commit hashes, so new hashes come from the commit map.
+    Returns None if any selected commit cannot be mapped, for example when filter-repo
+    has already run on this repository before.
+    """
+    commit_map = _read_commit_map(plan.repo_path)
+    if commit_map is None:
+        return None
+
+    rewritten: List[Commit] = []
+    for c, dt in zip(plan.selected, plan.final):
+        new_hash = commit_map.get(c.hash.lower())
+        if not new_hash or not new_hash.strip("0"):
+            return None
+        rewritten.append(replace(c, hash=new_hash, author_date=dt, committer_date=dt))
+
+    return rewritten
+
+
 def rewrite_history(
     *,
     repo_path: Path,
@@ -189,15 +282,20 @@ def rewrite_history(
     schema_path: Path,
     force: bool,
     allow_dirty: bool,
+    verify: bool = False,
 ) -> None:
     """
     Perform the history rewrite in-place on the target repository.
 
     This operation is destructive. Use --force only when you accept the consequences.
+
+    The final state report is built from the plan and git-filter-repo's commit map.
+    With verify, or when the commit map cannot be used, history is read back from git.
     """
-    repo_path = repo_path.expanduser().resolve()
-    config_path = config_path.expanduser().resolve()
-    schema_path = schema_path.expanduser().resolve()
+    repo_path = _fast_resolve(repo_path)
+    if str(config_path) != STDIN_CONFIG:
+        config_path = _fast_resolve(config_path)
+    schema_path = _fast_resolve(schema_path)
 
     plan = _build_rewrite_plan(repo_path, config_path, schema_path)
 
@@ -216,8 +314,8 @@ def rewrite_history(
     with tempfile.TemporaryDirectory() as td:
         td_path = Path(td)
 
-        mapping_path = td_path / "timestamp_map.json"
-        mapping_path.write_text(json.dumps(plan.date_map, indent=2), encoding="utf-8")
+        mapping_path = td_path / "timestamp_map.marshal"
+        mapping_path.write_bytes(marshal.dumps(plan.date_map))
 
         callback_body = _commit_callback_body(mapping_path)
 
@@ -248,20 +346,27 @@ def rewrite_history(
 
     # Print the final state table, using the same renderer as dry-run.
     # This is an audit-friendly confirmation of what the repository now looks like.
+    # The config was validated while planning; reuse it rather than reloading.
     try:
-        cfg = load_config(config_path, schema_path)
-        validated = validate_config(cfg)
-
-        new_commits = load_commit_history(repo_path)
-        selected_new, _untouched_new = apply_scope(new_commits, cfg.scope.fraction)
+        selected_new = None if verify else _planned_final_state(plan)
+
+        if selected_new is not None:
+            total_new = plan.total_commits
+            final_new: Sequence[datetime] = plan.final
+        else:
+            new_commits = load_commit_history(repo_path)
+            total_new = len(new_commits)
+            selected_new, _untouched_new = apply_scope(
+                new_commits, plan.scope_fraction, want_untouched=False
+            )
+            final_new = compute_timestamps(selected_new, plan.validated) if selected_new else []
 
-        final_new = compute_timestamps(selected_new, validated) if selected_new else {}
         entries = build_entries(selected_new, final_new, hash_len=12)
 
         report = render_dryrun_report(
-            total_commits=len(new_commits),
-            scope_fraction=cfg.scope.fraction,
-            mode=cfg.timestamp.mode,
+            total_commits=total_new,
+            scope_fraction=plan.scope_fraction,
+            mode=plan.mode,
             selected_commits=selected_new,
             entries=entries,
             hash_len=12,
@@ -282,8 +387,8 @@ def _build_parser() -> argparse.ArgumentParser:
     )
 
     parser.add_argument("--repo", required=True, help="Path to the target git repository")
-    parser.add_argument("--config", required=True, help="Path to rewrite policy YAML")
-    parser.add_argument("--schema", default=_default_schema_path(), help="Path to schema.json")
+    parser.add_argument("--config", required=True, help="Path to rewrite policy YAML, or - to read it from stdin")
+    parser.add_argument("--schema", default=_DEFAULT_SCHEMA_PATH, help="Path to schema.json")
 
     parser.add_argument(
         "--force",
@@ -295,6 +400,11 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Proceed even if the working tree has uncommitted changes",
     )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Read history back from git for the final report instead of deriving it from the plan",
+    )
 
     return parser
 
@@ -309,6 +419,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             schema_path=Path(args.schema),
             force=bool(args.force),
             allow_dirty=bool(args.allow_dirty),
+            verify=bool(args.verify),
         )
         return 0
 
@@ -27,6 +27,8 @@ class ScopeError(RuntimeError):
 def apply_scope(
     commits: List[Commit],
     fraction: float,
+    *,
+    want_untouched: bool = True,
 ) -> Tuple[List[Commit], List[Commit]]:
     """
     Apply scope fraction to commit list.
@@ -34,9 +36,13 @@ def apply_scope(
     Args:
         commits: full commit list (oldest -> newest)
         fraction: value in [-1.0, 1.0]
+        want_untouched: when False, the untouched list is not built and [] is returned
 
     Returns:
         (selected_commits, untouched_commits)
+
+    Either list may be the input list itself rather than a copy, so callers must treat
+    both as read-only.
     """
     if not -1.0 <= fraction <= 1.0:
         raise ScopeError(f"Invalid scope fraction: {fraction}")
@@ -44,18 +50,21 @@ def apply_scope(
     total = len(commits)
 
     if total == 0 or fraction == 0.0:
-        return [], commits[:]
+        return [], commits
+
+    if fraction == 1.0 or fraction == -1.0:
+        return commits, []
 
     k = floor(abs(fraction) * total)
 
     if k == 0:
-        return [], commits[:]
+        return [], commits
 
     if fraction > 0:
         selected = commits[:k]
-        untouched = commits[k:]
+        untouched = commits[k:] if want_untouched else []
     else:
         selected = commits[total - k :]
-        untouched = commits[: total - k]
+        untouched = commits[: total - k] if want_untouched else []
 
     return selected, untouched
@@ -19,13 +19,19 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import date, datetime, time, timezone, tzinfo
+from datetime import date, time, timezone, tzinfo
+from functools import lru_cache
 from typing import Any, Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from synth.config import Config, ScopeConfig, TimestampConfig
 
 
+# Timezone names that resolve to timezone.utc without tzdata. The common spellings are
+# listed as-is so they match without case folding; other casings fall back to .upper().
+_UTC_ALIASES = frozenset({"UTC", "Z", "ETC/UTC", "utc", "z", "etc/utc", "Etc/UTC"})
+
+
 class ValidationError(RuntimeError):
     """
     Raised when configuration is structurally valid but semantically invalid.
@@ -143,8 +149,9 @@ def validate_calendar(calendar: Mapping[str, Any]) -> ParsedCalendar:
     - start is on or before end
     - timezone resolves, or defaults to UTC when omitted
     """
-    start_raw = calendar.get("start")
-    end_raw = calendar.get("end")
+    get = calendar.get
+    start_raw = get("start")
+    end_raw = get("end")
 
     if not isinstance(start_raw, str):
         raise ValidationError("calendar.start", "start must be a string")
@@ -158,7 +165,7 @@ def validate_calendar(calendar: Mapping[str, Any]) -> ParsedCalendar:
     if start > end:
         raise ValidationError("calendar", "start must be on or before end")
 
-    tz_name_raw = calendar.get("timezone")
+    tz_name_raw = get("timezone")
     if tz_name_raw is None:
         tz_name = "UTC"
     else:
@@ -188,9 +195,10 @@ def validate_work_patterns(work_patterns: Mapping[str, Any]) -> ParsedWorkPatter
     - for enabled blocks, end is after start
     - for disabled blocks, hours must be absent
     """
-    weekdays_raw = work_patterns.get("weekdays")
-    saturday_raw = work_patterns.get("saturday")
-    sunday_raw = work_patterns.get("sunday")
+    get = work_patterns.get
+    weekdays_raw = get("weekdays")
+    saturday_raw = get("saturday")
+    sunday_raw = get("sunday")
 
     if not isinstance(weekdays_raw, Mapping):
         raise ValidationError("work_patterns.weekdays", "weekdays must be an object")
@@ -224,18 +232,19 @@ def validate_randomness(randomness: Mapping[str, Any]) -> ParsedRandomness:
     - seconds ranges remain within 0 to 59
     - seed is int or null
     """
-    seed_raw = randomness.get("seed")
+    get = randomness.get
+    seed_raw = get("seed")
     seed: Optional[int] = None
     if seed_raw is not None:
         if not _is_int(seed_raw):
             raise ValidationError("randomness.seed", "seed must be an integer or null")
         seed = int(seed_raw)
 
-    gap_raw = randomness.get("gap_minutes")
+    gap_raw = get("gap_minutes")
     if not isinstance(gap_raw, Mapping):
         raise ValidationError("randomness.gap_minutes", "gap_minutes must be an object")
 
-    sec_raw = randomness.get("seconds")
+    sec_raw = get("seconds")
     if not isinstance(sec_raw, Mapping):
         raise ValidationError("randomness.seconds", "seconds must be an object")
 
@@ -281,16 +290,14 @@ def _forbid_synthetic_sections(cfg: Config, mode: str) -> None:
 
 
 def _validate_work_block(path: str, block: Mapping[str, Any]) -> ParsedWorkBlock:
-    enabled_raw = block.get("enabled")
+    get = block.get
+    enabled_raw = get("enabled")
+    hours_raw = get("hours")
 
     if not isinstance(enabled_raw, bool):
         raise ValidationError(f"{path}.enabled", "enabled must be a boolean")
 
-    enabled = bool(enabled_raw)
-
-    hours_raw = block.get("hours")
-
-    if not enabled:
+    if not enabled_raw:
         if hours_raw is not None:
             raise ValidationError(f"{path}.hours", "hours must be omitted when enabled is false")
         return ParsedWorkBlock(enabled=False, hours=None)
@@ -298,8 +305,9 @@ def _validate_work_block(path: str, block: Mapping[str, Any]) -> ParsedWorkBlock
     if not isinstance(hours_raw, Mapping):
         raise ValidationError(f"{path}.hours", "hours must be an object when enabled is true")
 
-    start_raw = hours_raw.get("start")
-    end_raw = hours_raw.get("end")
+    hget = hours_raw.get
+    start_raw = hget("start")
+    end_raw = hget("end")
 
     if not isinstance(start_raw, str):
         raise ValidationError(f"{path}.hours.start", "start must be a string")
@@ -320,22 +328,33 @@ def _validate_work_block(path: str, block: Mapping[str, Any]) -> ParsedWorkBlock
 
 
 def _parse_date(path: str, value: str) -> date:
+    # Fixed YYYY-MM-DD shape, as enforced by the JSON Schema; slice rather than strptime.
+    # int() would also take signs, spaces and non-ASCII digits, so check the fields first.
+    digits = value[:4] + value[5:7] + value[8:]
+    if (
+        len(value) != 10
+        or value[4] != "-"
+        or value[7] != "-"
+        or not (digits.isascii() and digits.isdigit())
+    ):
+        raise ValidationError(path, f"invalid date: {value}")
+
     try:
-        return datetime.strptime(value, "%Y-%m-%d").date()
+        return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
     except ValueError as e:
         raise ValidationError(path, f"invalid date: {value}") from e
 
 
 def _parse_time(path: str, value: str) -> time:
-    parts = value.split(":")
-    if len(parts) != 2:
+    if len(value) != 5 or value[2] != ":":
         raise ValidationError(path, "time must use HH:MM format")
 
-    try:
-        h = int(parts[0])
-        m = int(parts[1])
-    except ValueError as e:
-        raise ValidationError(path, f"invalid time: {value}") from e
+    digits = value[:2] + value[3:]
+    if not (digits.isascii() and digits.isdigit()):
+        raise ValidationError(path, f"invalid time: {value}")
+
+    h = int(value[:2])
+    m = int(value[3:])
 
     if not (0 <= h <= 23):
         raise ValidationError(path, f"hour out of range: {h}")
@@ -347,12 +366,11 @@ def _parse_time(path: str, value: str) -> time:
 
 
 def _resolve_timezone(path: str, name: str) -> tzinfo:
-    upper = name.upper()
-    if upper in {"UTC", "Z", "ETC/UTC"}:
+    if name == "UTC" or name in _UTC_ALIASES or name.upper() in _UTC_ALIASES:
         return timezone.utc
 
     try:
-        return ZoneInfo(name)
+        return _zoneinfo_cached(name)
     except ZoneInfoNotFoundError as e:
         raise ValidationError(
             path,
@@ -362,6 +380,11 @@ def _resolve_timezone(path: str, name: str) -> tzinfo:
         raise ValidationError(path, f"invalid timezone: {name}") from e
 
 
+@lru_cache(maxsize=64)
+def _zoneinfo_cached(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
 def _require_int(obj: Mapping[str, Any], key: str, path: str) -> int:
     raw = obj.get(key)
     if not _is_int(raw):
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from django import forms
-from pathlib import Path
+from functools import lru_cache
 import math
+import os
+import time
 
 
 MODE_CHOICES = [
@@ -11,6 +13,78 @@ MODE_CHOICES = [
     ("synthetic", "Synthetic (generate new timeline)"),
 ]
 
+# Fields that must stay empty outside synthetic mode. A tuple rather than a set so
+# errors are attached in form order on every run.
+_SYNTHETIC_ONLY_FIELDS = (
+    "calendar_start",
+    "calendar_end",
+    "weekdays_start",
+    "weekdays_end",
+    "saturday_start",
+    "saturday_end",
+    "sunday_start",
+    "sunday_end",
+    "randomness_seed",
+    "gap_minutes_min",
+    "gap_minutes_max",
+    "seconds_min",
+    "seconds_max",
+)
+
+_INF = math.inf
+
+# Work pattern blocks, in form order.
+_WORK_BLOCKS = ("weekdays", "saturday", "sunday")
+
+# Errors attached with add_error are built once and shared. Django only reads them
+# after they are stored on a form. Errors that are raised stay per-call, since
+# raising an exception attaches a traceback to it.
+_ERR_SYNTHETIC_ONLY = forms.ValidationError("This field is only available in synthetic mode")
+_ERR_START_DATE_REQUIRED = forms.ValidationError("Synthetic mode requires a start date")
+_ERR_END_DATE_REQUIRED = forms.ValidationError("Synthetic mode requires an end date")
+_ERR_END_DATE_ORDER = forms.ValidationError("End date must be on or after start date")
+_ERR_GAP_RANGE = forms.ValidationError("Gap minutes max must be >= min")
+_ERR_SECONDS_RANGE = forms.ValidationError("Seconds max must be >= min")
+
+# prefix -> (start required, end required, end after start)
+_WORK_BLOCK_ERRORS = {
+    prefix: (
+        forms.ValidationError(f"{prefix.capitalize()} requires a start time"),
+        forms.ValidationError(f"{prefix.capitalize()} requires an end time"),
+        forms.ValidationError(f"{prefix.capitalize()} end time must be after start time"),
+    )
+    for prefix in _WORK_BLOCKS
+}
+
+# Successful repo_path checks are reused for up to this long, so Preview, Dry run and
+# Rewrite on the same repository do not each repeat the filesystem probes.
+_REPO_CHECK_TTL_SECONDS = 30
+
+
+@lru_cache(maxsize=256)
+def _check_repo(value: str, bucket: int) -> str:
+    """
+    Resolve value and confirm it is a Git repository; return the resolved path.
+
+    bucket is a coarse clock reading that only serves to expire cache entries. Failures
+    raise and so are never cached.
+    """
+    path = os.path.realpath(os.path.expanduser(value))
+
+    # One stat per probe. ".git" may be a directory or, for worktrees and
+    # submodules, a file pointing at the real git dir; both are accepted.
+    try:
+        os.stat(path)
+    except OSError:
+        raise forms.ValidationError("Path does not exist")
+
+    try:
+        os.stat(os.path.join(path, ".git"))
+    except OSError:
+        raise forms.ValidationError("Path is not a Git repository")
+
+    return path
+
 
 class RewriteConfigForm(forms.Form):
     """
@@ -138,24 +212,23 @@ class RewriteConfigForm(forms.Form):
 
     def clean_repo_path(self):
         value = self.cleaned_data["repo_path"]
-        path = Path(value).expanduser().resolve()
-
-        if not path.exists():
-            raise forms.ValidationError("Path does not exist")
-
-        if not (path / ".git").exists():
-            raise forms.ValidationError("Path is not a Git repository")
-
-        return str(path)
+        return _check_repo(value, int(time.monotonic()) // _REPO_CHECK_TTL_SECONDS)
 
     def clean_scope_fraction(self):
         value = self.cleaned_data["scope_fraction"]
-        if not math.isfinite(float(value)):
+        # FloatField has already produced a float; NaN fails both comparisons.
+        if not (-_INF < value < _INF):
             raise forms.ValidationError("Scope fraction must be a finite number")
         return value
 
     def clean(self):
         cleaned = super().clean()
+
+        # An invalid or missing mode already carries its own error and selects no
+        # branch below, so there is nothing further to check.
+        if self.has_error("mode"):
+            return cleaned
+
         mode = cleaned.get("mode")
 
         # -----------------------------
@@ -163,28 +236,11 @@ class RewriteConfigForm(forms.Form):
         # -----------------------------
         if mode in ("author", "commit"):
             # Synthetic fields must be empty. Use "is not None" checks so falsy values like 0 do not slip through.
-            synthetic_fields = [
-                "calendar_start",
-                "calendar_end",
-                "weekdays_start",
-                "weekdays_end",
-                "saturday_start",
-                "saturday_end",
-                "sunday_start",
-                "sunday_end",
-                "randomness_seed",
-                "gap_minutes_min",
-                "gap_minutes_max",
-                "seconds_min",
-                "seconds_max",
-            ]
-
-            for field in synthetic_fields:
-                if field in cleaned and cleaned.get(field) is not None:
-                    self.add_error(
-                        field,
-                        "This field is only available in synthetic mode",
-                    )
+            # A field missing from cleaned (it failed its own validation) reads as None here.
+            get = cleaned.get
+            for field in _SYNTHETIC_ONLY_FIELDS:
+                if get(field) is not None:
+                    self.add_error(field, _ERR_SYNTHETIC_ONLY)
 
             return cleaned
 
@@ -196,12 +252,12 @@ class RewriteConfigForm(forms.Form):
             end = cleaned.get("calendar_end")
 
             if start is None:
-                self.add_error("calendar_start", "Synthetic mode requires a start date")
+                self.add_error("calendar_start", _ERR_START_DATE_REQUIRED)
             if end is None:
-                self.add_error("calendar_end", "Synthetic mode requires an end date")
+                self.add_error("calendar_end", _ERR_END_DATE_REQUIRED)
 
             if start is not None and end is not None and start > end:
-                self.add_error("calendar_end", "End date must be on or after start date")
+                self.add_error("calendar_end", _ERR_END_DATE_ORDER)
 
             # At least one work block must be enabled
             if not (
@@ -211,32 +267,23 @@ class RewriteConfigForm(forms.Form):
             ):
                 raise forms.ValidationError("At least one work pattern must be enabled")
 
-            self._validate_work_block(
-                cleaned,
-                "weekdays",
-                cleaned.get("weekdays_enabled"),
-            )
-            self._validate_work_block(
-                cleaned,
-                "saturday",
-                cleaned.get("saturday_enabled"),
-            )
-            self._validate_work_block(
-                cleaned,
-                "sunday",
-                cleaned.get("sunday_enabled"),
-            )
+            for prefix in _WORK_BLOCKS:
+                self._validate_work_block(
+                    cleaned,
+                    prefix,
+                    cleaned.get(f"{prefix}_enabled"),
+                )
 
             # Randomness ranges
             gmin = cleaned.get("gap_minutes_min")
             gmax = cleaned.get("gap_minutes_max")
             if gmin is not None and gmax is not None and gmin > gmax:
-                self.add_error("gap_minutes_max", "Gap minutes max must be >= min")
+                self.add_error("gap_minutes_max", _ERR_GAP_RANGE)
 
             smin = cleaned.get("seconds_min")
             smax = cleaned.get("seconds_max")
             if smin is not None and smax is not None and smin > smax:
-                self.add_error("seconds_max", "Seconds max must be >= min")
+                self.add_error("seconds_max", _ERR_SECONDS_RANGE)
 
         return cleaned
 
@@ -250,10 +297,12 @@ class RewriteConfigForm(forms.Form):
         start = cleaned.get(start_field)
         end = cleaned.get(end_field)
 
+        err_start_required, err_end_required, err_order = _WORK_BLOCK_ERRORS[prefix]
+
         if start is None:
-            self.add_error(start_field, f"{prefix.capitalize()} requires a start time")
+            self.add_error(start_field, err_start_required)
         if end is None:
-            self.add_error(end_field, f"{prefix.capitalize()} requires an end time")
+            self.add_error(end_field, err_end_required)
 
         if start is not None and end is not None and start >= end:
-            self.add_error(end_field, f"{prefix.capitalize()} end time must be after start time")
+            self.add_error(end_field, err_order)
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping, Sequence
+import asyncio
 import os
 import re
 import sys
-import tempfile
 import subprocess
 
-from user_ui.yaml_emit import build_yaml
+from user_ui.yaml_emit import POLICY_FIELDS, build_yaml
 
 
 class ServiceError(RuntimeError):
@@ -27,19 +28,29 @@ class CommandResult:
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+# Command-line pieces that never change for the life of the process.
+_MAIN_PY = str(_PROJECT_ROOT / "main.py")
+_SYS_EXECUTABLE = sys.executable
+
 
 _GIT_BASH_PATH_RE = re.compile(r"^/([a-zA-Z])/(.+)$")
 
+_IS_WINDOWS = os.name == "nt"
+
 
 _DEFAULT_DRY_RUN_TIMEOUT_SECONDS = 60
 _DEFAULT_REWRITE_TIMEOUT_SECONDS = 600
 
+# How long to keep reading a killed process's pipes before giving up on EOF.
+_KILL_GRACE_SECONDS = 2
+_READ_CHUNK_SIZE = 64 * 1024
+
 
 def preview_yaml(cleaned_data: Mapping[str, Any]) -> str:
     """
     Render the exact YAML that will be executed, without writing any files.
     """
-    return build_yaml(cleaned_data)
+    return _policy_yaml(cleaned_data)
 
 
 def browse_repo_directory(initial_dir: str | None = None) -> str | None:
@@ -51,11 +62,7 @@ def browse_repo_directory(initial_dir: str | None = None) -> str | None:
 
     Returns None if the user cancels.
     """
-    try:
-        import tkinter as tk
-        from tkinter import filedialog
-    except Exception as e:
-        raise ServiceError("Folder picker is unavailable on this environment") from e
+    tk, filedialog = _tkinter_modules()
 
     initial = None
     if initial_dir:
@@ -84,13 +91,31 @@ def browse_repo_directory(initial_dir: str | None = None) -> str | None:
         return None
 
     p = str(Path(selected).expanduser().resolve())
-    if os.name == "nt":
+    if _IS_WINDOWS:
         p = p.replace("\\", "/")
 
     return p
 
 
-def run_dry_run(
+@lru_cache(maxsize=None)
+def _tkinter_modules() -> tuple[Any, Any]:
+    """
+    Import tkinter and its filedialog once per process.
+
+    The Tk root itself is still created per call: Tcl interpreters are bound to the
+    thread that created them, and the dev server handles each request on a new thread.
+    A failed import is not cached, so it is retried and reported on every call.
+    """
+    try:
+        import tkinter as tk
+        from tkinter import filedialog
+    except Exception as e:
+        raise ServiceError("Folder picker is unavailable on this environment") from e
+
+    return tk, filedialog
+
+
+async def run_dry_run_async(
     cleaned_data: Mapping[str, Any],
     *,
     hash_len: int | None = None,
@@ -99,35 +124,16 @@ def run_dry_run(
     """
     Execute a dry run and return captured stdout and stderr.
 
-    Writes policy YAML to a temp file and removes it immediately after the process ends.
+    The policy YAML is piped to the CLI on stdin (--config -); nothing is written to disk.
+    The CLI is awaited rather than blocking a thread for the whole run.
     """
-    repo_path = _normalise_repo_path(str(cleaned_data["repo_path"]))
-    yaml_text = build_yaml(cleaned_data)
-
-    with tempfile.TemporaryDirectory() as td:
-        td_path = Path(td)
-        policy_path = td_path / "rewrite.yaml"
-        policy_path.write_text(yaml_text, encoding="utf-8", newline="\n")
-
-        cmd = [
-            sys.executable,
-            str(_PROJECT_ROOT / "main.py"),
-            "--repo",
-            repo_path,
-            "--config",
-            str(policy_path),
-            "--dry-run",
-        ]
-
-        if hash_len is not None:
-            if int(hash_len) <= 0:
-                raise ServiceError("hash_len must be a positive integer")
-            cmd.extend(["--hash-len", str(int(hash_len))])
-
-        return _run(cmd, cwd=_PROJECT_ROOT, timeout_seconds=timeout_seconds)
+    cmd, yaml_text = _dry_run_command(cleaned_data, hash_len)
+    return await _run_async(
+        cmd, cwd=_PROJECT_ROOT, timeout_seconds=timeout_seconds, input_text=yaml_text
+    )
 
 
-def run_rewrite(
+async def run_rewrite_async(
     cleaned_data: Mapping[str, Any],
     *,
     timeout_seconds: int | None = _DEFAULT_REWRITE_TIMEOUT_SECONDS,
@@ -138,80 +144,215 @@ def run_rewrite(
     Safety:
     The caller must provide confirm_rewrite in cleaned_data.
     """
+    cmd, yaml_text = _rewrite_command(cleaned_data)
+    return await _run_async(
+        cmd, cwd=_PROJECT_ROOT, timeout_seconds=timeout_seconds, input_text=yaml_text
+    )
+
+
+def _dry_run_command(
+    cleaned_data: Mapping[str, Any],
+    hash_len: int | None,
+) -> tuple[list[str], str]:
+    repo_path = _normalise_repo_path(str(cleaned_data["repo_path"]))
+    yaml_text = _policy_yaml(cleaned_data)
+
+    cmd = [
+        _SYS_EXECUTABLE,
+        _MAIN_PY,
+        "--repo",
+        repo_path,
+        "--config",
+        "-",
+        "--dry-run",
+    ]
+
+    if hash_len is not None:
+        if int(hash_len) <= 0:
+            raise ServiceError("hash_len must be a positive integer")
+        cmd.extend(["--hash-len", str(int(hash_len))])
+
+    return cmd, yaml_text
+
+
+def _rewrite_command(cleaned_data: Mapping[str, Any]) -> tuple[list[str], str]:
     if not bool(cleaned_data.get("confirm_rewrite")):
         raise ServiceError("Rewrite requires confirm_rewrite to be checked")
 
     repo_path = _normalise_repo_path(str(cleaned_data["repo_path"]))
     allow_dirty = bool(cleaned_data.get("allow_dirty"))
-    yaml_text = build_yaml(cleaned_data)
+    yaml_text = _policy_yaml(cleaned_data)
+
+    cmd = [
+        _SYS_EXECUTABLE,
+        "-m",
+        "synth.rewrite",
+        "--repo",
+        repo_path,
+        "--config",
+        "-",
+        "--force",
+    ]
+
+    if allow_dirty:
+        cmd.append("--allow-dirty")
+
+    return cmd, yaml_text
+
+
+def _policy_yaml(cleaned_data: Mapping[str, Any]) -> str:
+    """
+    Return build_yaml(cleaned_data), reusing the text rendered for an identical policy.
+
+    Preview, dry run and rewrite usually submit the same form in turn, so the YAML is
+    dumped once and looked up afterwards. The key holds only the fields the policy is
+    built from, so repo_path, allow_dirty and confirm_rewrite do not defeat the cache.
+    Form values are hashable scalars; anything else bypasses the cache.
+    """
+    key = tuple(
+        (name, *_value_key(cleaned_data[name]))
+        for name in POLICY_FIELDS
+        if name in cleaned_data
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return build_yaml(cleaned_data)
 
-    with tempfile.TemporaryDirectory() as td:
-        td_path = Path(td)
-        policy_path = td_path / "rewrite.yaml"
-        policy_path.write_text(yaml_text, encoding="utf-8", newline="\n")
+    return _build_yaml_cached(key)
 
-        cmd = [
-            sys.executable,
-            "-m",
-            "synth.rewrite",
-            "--repo",
-            repo_path,
-            "--config",
-            str(policy_path),
-            "--force",
-        ]
 
-        if allow_dirty:
-            cmd.append("--allow-dirty")
+def _value_key(value: Any) -> tuple:
+    # Equal values can render differently: True == 1, and 0.0 == -0.0 while their YAML
+    # differs. Key on the type, and on repr for floats, besides the value itself.
+    if isinstance(value, float):
+        return float, repr(value), value
+    return type(value), value
 
-        return _run(cmd, cwd=_PROJECT_ROOT, timeout_seconds=timeout_seconds)
 
+@lru_cache(maxsize=32)
+def _build_yaml_cached(key: tuple) -> str:
+    return build_yaml({entry[0]: entry[-1] for entry in key})
 
-def _run(cmd: Sequence[str], *, cwd: Path, timeout_seconds: int | None) -> CommandResult:
+
+async def _run_async(
+    cmd: Sequence[str],
+    *,
+    cwd: Path,
+    timeout_seconds: int | None,
+    input_text: str | None = None,
+) -> CommandResult:
     """
-    Run a subprocess and capture stdout and stderr.
+    Run a subprocess with asyncio and capture stdout and stderr.
+
+    input_text, when given, is written to the process's stdin. Output is collected as
+    bytes while the process runs and decoded once at the end. On timeout the process is
+    killed and whatever it had written so far is returned.
     """
+    input_bytes = input_text.encode("utf-8") if input_text is not None else None
+
     try:
-        completed = subprocess.run(
-            list(cmd),
-            cwd=str(cwd),
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdin=subprocess.PIPE if input_bytes is not None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=False,
-            timeout=timeout_seconds,
         )
-    except subprocess.TimeoutExpired as e:
-        stdout = ""
-        stderr = ""
-        if getattr(e, "stdout", None):
-            stdout = e.stdout if isinstance(e.stdout, str) else ""
-        if getattr(e, "stderr", None):
-            stderr = e.stderr if isinstance(e.stderr, str) else ""
+    except FileNotFoundError as e:
+        raise ServiceError(f"Command not found: {cmd[0]}") from e
+    except Exception as e:
+        raise ServiceError(f"Failed to run command: {cmd[0]}") from e
+
+    stdout = bytearray()
+    stderr = bytearray()
+    io_tasks = [
+        asyncio.create_task(_drain(proc.stdout, stdout)),
+        asyncio.create_task(_drain(proc.stderr, stderr)),
+    ]
+    if input_bytes is not None:
+        io_tasks.append(asyncio.create_task(_feed(proc.stdin, input_bytes)))
+
+    try:
+        await asyncio.wait_for(proc.wait(), timeout_seconds)
+    except asyncio.TimeoutError:
+        await _kill_and_reap(proc, io_tasks)
 
         return CommandResult(
             ok=False,
             returncode=124,
             cmd=list(cmd),
-            stdout=stdout,
-            stderr=(stderr or "") + "\nprocess timed out",
+            stdout=_decode_output(bytes(stdout)),
+            stderr=_decode_output(bytes(stderr)) + "\nprocess timed out",
         )
-    except FileNotFoundError as e:
-        raise ServiceError(f"Command not found: {cmd[0]}") from e
-    except Exception as e:
-        raise ServiceError(f"Failed to run command: {cmd[0]}") from e
+    except BaseException:
+        # The awaiting request was cancelled: do not leave the CLI running.
+        await _kill_and_reap(proc, io_tasks)
+        raise
+
+    await asyncio.gather(*io_tasks)
 
     return CommandResult(
-        ok=completed.returncode == 0,
-        returncode=int(completed.returncode),
+        ok=proc.returncode == 0,
+        returncode=int(proc.returncode),
         cmd=list(cmd),
-        stdout=completed.stdout or "",
-        stderr=completed.stderr or "",
+        stdout=_decode_output(bytes(stdout)),
+        stderr=_decode_output(bytes(stderr)),
     )
 
 
+async def _kill_and_reap(proc: asyncio.subprocess.Process, io_tasks: list) -> None:
+    """
+    Kill proc, then give it and its pipe readers a short grace period to finish.
+
+    Grandchildren (git under filter-repo) can keep the pipes open after the kill, and
+    proc.wait() also waits for the pipes to close, so neither is awaited to completion.
+    """
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        pass
+
+    waiter = asyncio.ensure_future(proc.wait())
+    _done, pending = await asyncio.wait([waiter, *io_tasks], timeout=_KILL_GRACE_SECONDS)
+    for task in pending:
+        task.cancel()
+
+
+async def _drain(stream: asyncio.StreamReader, buf: bytearray) -> None:
+    while True:
+        chunk = await stream.read(_READ_CHUNK_SIZE)
+        if not chunk:
+            return
+        buf += chunk
+
+
+async def _feed(stream: asyncio.StreamWriter, data: bytes) -> None:
+    try:
+        stream.write(data)
+        await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # The child exited without reading all of its input; its output says why.
+        pass
+    finally:
+        stream.close()
+
+
+def _decode_output(data: bytes | None) -> str:
+    """
+    Decode captured output as UTF-8, replacing invalid bytes.
+
+    Line endings are normalised to LF, as a text-mode pipe would do.
+    """
+    if not data:
+        return ""
+
+    text = data.decode("utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def _normalise_repo_path(path_str: str) -> str:
     """
     Normalise Git Bash style paths to Windows drive paths when running on Windows.
@@ -221,7 +362,12 @@ def _normalise_repo_path(path_str: str) -> str:
     """
     p = path_str.strip()
 
-    if os.name != "nt":
+    if not _IS_WINDOWS:
+        return p
+
+    # Cheap shape check first: only "/x/..." can match, so native paths such as
+    # C:\Users\... skip the regex entirely.
+    if len(p) < 4 or p[0] != "/" or p[2] != "/":
         return p
 
     m = _GIT_BASH_PATH_RE.match(p)
@@ -1,3 +1,214 @@
-from django.test import TestCase
+from datetime import date, datetime, time, timezone
+from itertools import product
+from typing import Any, Dict, List, Mapping
 
-# Create your tests here.
+import yaml
+from django.test import SimpleTestCase
+
+from synth.config import ScopeConfig, TimestampConfig
+from synth.engine import compute_timestamps
+from synth.repo import Commit
+from synth.validation import (
+    ParsedCalendar,
+    ParsedRandomness,
+    ParsedWorkBlock,
+    ParsedWorkHours,
+    ParsedWorkPatterns,
+    ValidatedConfig,
+)
+from user_ui.services import _build_yaml_cached, _policy_yaml
+from user_ui.yaml_emit import build_policy_dict, build_yaml
+
+
+_EDGE_FRACTIONS = (0.0, 1.0, 0.5, 0.1, 1 / 3, 1e-17, 5e-324, 1e-05, 0.0001, 123456789.0)
+
+
+def _unshared(value: Any) -> Any:
+    # build_policy_dict shares sub-mappings between blocks; copy them so safe_dump
+    # writes each one out in full instead of as an anchor and alias.
+    if isinstance(value, Mapping):
+        return {k: _unshared(v) for k, v in value.items()}
+    return value
+
+
+def _safe_dump(cleaned_data: Mapping[str, Any]) -> str:
+    return yaml.safe_dump(
+        _unshared(build_policy_dict(cleaned_data)),
+        sort_keys=False,
+        default_flow_style=False,
+    )
+
+
+def _synthetic_data(**overrides: Any) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "mode": "synthetic",
+        "scope_fraction": 1.0,
+        "calendar_start": date(2015, 6, 1),
+        "calendar_end": date(2015, 7, 31),
+        "weekdays_enabled": True,
+        "weekdays_start": time(9, 0),
+        "weekdays_end": time(17, 30),
+        "saturday_enabled": False,
+        "saturday_start": None,
+        "saturday_end": None,
+        "sunday_enabled": False,
+        "sunday_start": None,
+        "sunday_end": None,
+        "randomness_seed": None,
+        "gap_minutes_min": None,
+        "gap_minutes_max": None,
+        "seconds_min": None,
+        "seconds_max": None,
+    }
+    data.update(overrides)
+    return data
+
+
+class BuildYamlParityTests(SimpleTestCase):
+    """
+    build_yaml formats policies itself; its output must match yaml.safe_dump exactly.
+    """
+
+    def assertParity(self, cleaned_data: Mapping[str, Any]) -> None:
+        self.assertEqual(build_yaml(cleaned_data), _safe_dump(cleaned_data))
+
+    def test_simple_modes(self):
+        for mode, fraction in product(("author", "commit"), _EDGE_FRACTIONS):
+            with self.subTest(mode=mode, fraction=fraction):
+                self.assertParity({"mode": mode, "scope_fraction": fraction})
+
+    def test_synthetic_fractions(self):
+        for fraction in _EDGE_FRACTIONS:
+            with self.subTest(fraction=fraction):
+                self.assertParity(_synthetic_data(scope_fraction=fraction))
+
+    def test_synthetic_work_block_mixes(self):
+        hours = {
+            "weekdays": (time(9, 0), time(17, 30)),
+            "saturday": (time(0, 0), time(12, 0)),
+            "sunday": (time(10, 15), time(23, 59)),
+        }
+
+        for enabled in product((True, False), repeat=3):
+            overrides: Dict[str, Any] = {}
+            for prefix, on in zip(hours, enabled):
+                start, end = hours[prefix] if on else (None, None)
+                overrides[f"{prefix}_enabled"] = on
+                overrides[f"{prefix}_start"] = start
+                overrides[f"{prefix}_end"] = end
+
+            with self.subTest(enabled=enabled):
+                self.assertParity(_synthetic_data(**overrides))
+
+    def test_synthetic_randomness_overrides(self):
+        cases = (
+            {},
+            {"randomness_seed": 0},
+            {"randomness_seed": 42, "gap_minutes_min": 0, "gap_minutes_max": 0},
+            {"gap_minutes_min": 200},
+            {"gap_minutes_max": 10, "seconds_min": 70},
+            {"seconds_min": 30, "seconds_max": 10},
+        )
+        for overrides in cases:
+            with self.subTest(overrides=overrides):
+                self.assertParity(_synthetic_data(**overrides))
+
+    def test_fallback_path(self):
+        # Non-finite floats are left to PyYAML; the output must still match.
+        for fraction in (float("inf"), float("nan")):
+            with self.subTest(fraction=fraction):
+                self.assertParity({"mode": "author", "scope_fraction": fraction})
+
+
+class PolicyYamlCacheTests(SimpleTestCase):
+    def setUp(self):
+        _build_yaml_cached.cache_clear()
+
+    def test_ignores_fields_outside_the_policy(self):
+        data = _synthetic_data(repo_path="/repo", allow_dirty=False, confirm_rewrite=False)
+        _policy_yaml(data)
+        _policy_yaml({**data, "confirm_rewrite": True, "calendar_timezone": "UTC"})
+
+        info = _build_yaml_cached.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_equal_floats_that_render_differently(self):
+        # 0.0 == -0.0, but they dump as different YAML.
+        _policy_yaml({"mode": "author", "scope_fraction": 0.0})
+        data = {"mode": "author", "scope_fraction": -0.0}
+        self.assertEqual(_policy_yaml(data), build_yaml(data))
+
+
+def _synthetic_config(
+    weekdays: ParsedWorkBlock,
+    saturday: ParsedWorkBlock,
+    end: date,
+    randomness: ParsedRandomness,
+) -> ValidatedConfig:
+    return ValidatedConfig(
+        timestamp=TimestampConfig("synthetic"),
+        scope=ScopeConfig(1.0),
+        calendar=ParsedCalendar(date(2015, 6, 5), end, "UTC", timezone.utc),
+        work_patterns=ParsedWorkPatterns(weekdays, saturday, ParsedWorkBlock(False, None)),
+        randomness=randomness,
+    )
+
+
+def _commits(count: int) -> List[Commit]:
+    placeholder = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    return [
+        Commit(hash=f"{i:040x}", author_date=placeholder, committer_date=placeholder, index=i)
+        for i in range(count)
+    ]
+
+
+def _hours(start: time, end: time) -> ParsedWorkBlock:
+    return ParsedWorkBlock(True, ParsedWorkHours(start, end))
+
+
+class SyntheticTimelineTests(SimpleTestCase):
+    def test_carry_over_into_midnight_window(self):
+        # Friday 2015-06-05: the first commit lands at 09:00:00 and a fixed 885 minute
+        # gap carries the next one to 23:45, after Friday's window. Saturday's window
+        # opens at 00:00, so the carried-over candidate restarts at exactly midnight.
+        config = _synthetic_config(
+            weekdays=_hours(time(9, 0), time(9, 0)),
+            saturday=_hours(time(0, 0), time(12, 0)),
+            end=date(2015, 6, 6),
+            randomness=ParsedRandomness(1, 885, 885, 0, 0),
+        )
+
+        self.assertEqual(
+            compute_timestamps(_commits(2), config),
+            [
+                datetime(2015, 6, 5, 9, 0, 0, tzinfo=timezone.utc),
+                datetime(2015, 6, 6, 0, 0, 0, tzinfo=timezone.utc),
+            ],
+        )
+
+    def test_seeded_timeline_is_stable(self):
+        # Pins the output for one seed, across a midnight carry-over into Saturday and
+        # a skipped Sunday, so refactors of the walk cannot change it silently.
+        config = _synthetic_config(
+            weekdays=_hours(time(9, 0), time(17, 30)),
+            saturday=_hours(time(0, 0), time(12, 0)),
+            end=date(2015, 6, 30),
+            randomness=ParsedRandomness(20150605, 60, 600, 5, 55),
+        )
+
+        expected = [
+            "2015-06-05T12:10:21+00:00",
+            "2015-06-05T14:53:12+00:00",
+            "2015-06-05T16:58:48+00:00",
+            "2015-06-06T00:00:00+00:00",
+            "2015-06-06T08:32:17+00:00",
+            "2015-06-08T13:37:16+00:00",
+            "2015-06-08T15:39:35+00:00",
+            "2015-06-09T11:21:31+00:00",
+            "2015-06-10T17:11:10+00:00",
+            "2015-06-11T12:14:30+00:00",
+            "2015-06-11T14:48:04+00:00",
+            "2015-06-12T11:35:07+00:00",
+        ]
+        timeline = compute_timestamps(_commits(len(expected)), config)
+        self.assertEqual([dt.isoformat() for dt in timeline], expected)
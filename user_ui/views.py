@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from asgiref.sync import sync_to_async
 from django.shortcuts import render
 from django.http import HttpRequest, HttpResponse
 
@@ -7,22 +8,27 @@ from user_ui.forms import RewriteConfigForm
 from user_ui.services import (
     ServiceError,
     preview_yaml,
-    run_dry_run,
-    run_rewrite,
+    run_dry_run_async,
+    run_rewrite_async,
     browse_repo_directory,
 )
 
 
+_SKIP = frozenset(("csrfmiddlewaretoken", "action"))
+
+
 def _initial_from_post(post) -> dict:
-    initial: dict = {}
-    for k, v in post.items():
-        if k in ("csrfmiddlewaretoken", "action"):
-            continue
-        initial[k] = v
-    return initial
+    return {k: v for k, v in post.items() if k not in _SKIP}
+
 
+async def index(request: HttpRequest) -> HttpResponse:
+    """
+    Single-page UI.
 
-def index(request: HttpRequest) -> HttpResponse:
+    Async so that dry runs and rewrites await their CLI subprocess instead of holding a
+    worker thread for the whole run. The folder picker blocks on a native dialog, so it
+    is pushed to a worker thread.
+    """
     yaml_preview_text: str | None = None
     command_result = None
     action: str | None = None
@@ -35,7 +41,7 @@ def index(request: HttpRequest) -> HttpResponse:
             initial = _initial_from_post(request.POST)
 
             try:
-                chosen = browse_repo_directory(initial.get("repo_path"))
+                chosen = await sync_to_async(browse_repo_directory)(initial.get("repo_path"))
                 if chosen:
                     initial["repo_path"] = chosen
             except ServiceError as e:
@@ -61,7 +67,7 @@ def index(request: HttpRequest) -> HttpResponse:
                     yaml_preview_text = preview_yaml(cleaned)
 
                 elif action == "dry_run":
-                    command_result = run_dry_run(cleaned, hash_len=12)
+                    command_result = await run_dry_run_async(cleaned, hash_len=12)
 
                 elif action == "rewrite":
                     if not cleaned.get("confirm_rewrite"):
@@ -70,7 +76,7 @@ def index(request: HttpRequest) -> HttpResponse:
                             "You must confirm the rewrite before execution",
                         )
                     else:
-                        command_result = run_rewrite(cleaned)
+                        command_result = await run_rewrite_async(cleaned)
 
                 else:
                     form.add_error(None, "Unknown action")
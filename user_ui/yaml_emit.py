@@ -2,7 +2,11 @@
 from __future__ import annotations
 
 from datetime import date, time
-from typing import Any, Dict, Mapping
+import math
+from operator import itemgetter
+import re
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 import yaml
 
@@ -16,11 +20,37 @@ class QuotedString(str):
     """
 
 
+# LibYAML's emitter when available; same output as the pure Python SafeDumper.
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+
 def _quoted_str_representer(dumper: yaml.SafeDumper, data: QuotedString):
-    return dumper.represent_scalar("tag:yaml.org,2002:str", data, style='"')
+    # The C emitter accepts only exact str scalars, not subclasses.
+    return dumper.represent_scalar("tag:yaml.org,2002:str", str(data), style='"')
+
+
+class _PolicyDumper(_Dumper):
+    """
+    Dumper for policy dicts.
+
+    Policies share constant sub-mappings (see _DISABLED), which must be written out in
+    full each time rather than as YAML anchors and aliases.
+    """
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
 
+def _mapping_proxy_representer(dumper: yaml.SafeDumper, data: MappingProxyType):
+    return dumper.represent_dict(data)
 
-yaml.add_representer(QuotedString, _quoted_str_representer, Dumper=yaml.SafeDumper)
+
+for _dumper in (yaml.SafeDumper, _PolicyDumper):
+    yaml.add_representer(QuotedString, _quoted_str_representer, Dumper=_dumper)
+    yaml.add_representer(MappingProxyType, _mapping_proxy_representer, Dumper=_dumper)
 
 
 _DEFAULT_GAP_MIN = 25
@@ -28,6 +58,41 @@ _DEFAULT_GAP_MAX = 90
 _DEFAULT_SEC_MIN = 5
 _DEFAULT_SEC_MAX = 55
 
+# Modes whose policy is just timestamp and scope.
+_SIMPLE_MODES = frozenset(("author", "commit"))
+
+_WORK_BLOCKS = ("weekdays", "saturday", "sunday")
+
+_RANDOMNESS_KEYS = (
+    "randomness_seed",
+    "gap_minutes_min",
+    "gap_minutes_max",
+    "seconds_min",
+    "seconds_max",
+)
+_get_randomness = itemgetter(*_RANDOMNESS_KEYS)
+
+# Every cleaned_data key build_policy_dict reads; the rest of the form does not affect
+# the policy.
+POLICY_FIELDS = (
+    "mode",
+    "scope_fraction",
+    "calendar_start",
+    "calendar_end",
+    *(f"{prefix}_{field}" for prefix in _WORK_BLOCKS for field in ("enabled", "start", "end")),
+    *_RANDOMNESS_KEYS,
+)
+
+# Shared by every disabled work block; a read-only view so the sharing cannot leak
+# mutations between policies.
+_DISABLED: Mapping[str, Any] = MappingProxyType({"enabled": False})
+
+
+# Strings build_yaml may emit unquoted: bare identifiers that PyYAML would not resolve
+# to a bool or null on load. Anything else sends the document through PyYAML.
+_PLAIN_SAFE_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]*")
+_PLAIN_RESERVED = frozenset({"yes", "no", "true", "false", "on", "off", "null"})
+
 
 def build_policy_dict(cleaned_data: Mapping[str, Any]) -> Dict[str, Any]:
     """
@@ -38,78 +103,175 @@ def build_policy_dict(cleaned_data: Mapping[str, Any]) -> Dict[str, Any]:
     2) synthetic mode emits timestamp, scope, calendar, work_patterns, randomness
     3) synthetic randomness always emits defaults unless overridden
     4) date and time strings are emitted as quoted strings to avoid YAML implicit typing
+
+    The returned dict may share constant sub-mappings between calls; treat it as
+    read-only.
     """
     mode = str(cleaned_data["mode"])
     scope_fraction = float(cleaned_data["scope_fraction"])
 
-    policy: Dict[str, Any] = {
-        "timestamp": {"mode": mode},
-        "scope": {"fraction": scope_fraction},
-    }
-
-    if mode in {"author", "commit"}:
-        return policy
+    if mode in _SIMPLE_MODES:
+        return {
+            "timestamp": {"mode": mode},
+            "scope": {"fraction": scope_fraction},
+        }
 
     if mode != "synthetic":
         raise ValueError(f"Unsupported mode: {mode}")
 
     start_date: date = cleaned_data["calendar_start"]
-    end_date: date = cleaned_data["calendar_end"]
-
-    policy["calendar"] = {
-        "start": QuotedString(start_date.isoformat()),
-        "end": QuotedString(end_date.isoformat()),
-        "timezone": "UTC",
-    }
 
-    policy["work_patterns"] = {
-        "weekdays": _build_work_block(cleaned_data, "weekdays"),
-        "saturday": _build_work_block(cleaned_data, "saturday"),
-        "sunday": _build_work_block(cleaned_data, "sunday"),
+    return {
+        "timestamp": {"mode": mode},
+        "scope": {"fraction": scope_fraction},
+        "calendar": _build_calendar(cleaned_data, start_date),
+        "work_patterns": _build_work_blocks(cleaned_data),
+        "randomness": _build_randomness(cleaned_data, start_date),
     }
 
-    policy["randomness"] = _build_randomness(cleaned_data, start_date)
-
-    return policy
-
 
 def build_yaml(cleaned_data: Mapping[str, Any]) -> str:
     """
     Build YAML text from validated form.cleaned_data.
     """
     policy = build_policy_dict(cleaned_data)
-    return yaml.safe_dump(
+
+    text = _emit_policy(policy)
+    if text is not None:
+        return text
+
+    return yaml.dump(
         policy,
+        Dumper=_PolicyDumper,
         sort_keys=False,
         default_flow_style=False,
     )
 
 
-def _build_work_block(cleaned_data: Mapping[str, Any], prefix: str) -> Dict[str, Any]:
-    enabled = bool(cleaned_data.get(f"{prefix}_enabled"))
+def _emit_policy(policy: Mapping[str, Any]) -> Optional[str]:
+    """
+    Emit the policy dict directly, byte for byte as yaml.safe_dump would.
+
+    The policy is a small fixed shape: nested mappings of identifier keys to ints,
+    floats, bools, identifier strings and QuotedString values. Formatting it here skips
+    PyYAML's representer and emitter machinery. Returns None when a value falls outside
+    that shape, so the caller can fall back to PyYAML.
+    """
+    lines: List[str] = []
+    if not _emit_mapping(lines, policy, ""):
+        return None
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _emit_mapping(lines: List[str], mapping: Mapping[str, Any], indent: str) -> bool:
+    if not mapping:
+        return False
+
+    for key, value in mapping.items():
+        if not _is_plain_safe(key):
+            return False
+
+        if isinstance(value, Mapping):
+            lines.append(f"{indent}{key}:")
+            if not _emit_mapping(lines, value, indent + "  "):
+                return False
+            continue
+
+        scalar = _emit_scalar(value)
+        if scalar is None:
+            return False
+        lines.append(f"{indent}{key}: {scalar}")
+
+    return True
+
+
+def _emit_scalar(value: Any) -> Optional[str]:
+    if isinstance(value, QuotedString):
+        if (
+            len(value) > 40
+            or not value.isascii()
+            or not value.isprintable()
+            or '"' in value
+            or "\\" in value
+        ):
+            return None
+        return f'"{value}"'
+
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    if isinstance(value, int):
+        return str(value)
+
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return None
+        # Mirrors SafeRepresenter.represent_float for finite values.
+        text = repr(value).lower()
+        if "." not in text and "e" in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+
+    if isinstance(value, str) and _is_plain_safe(value):
+        return value
+
+    return None
+
+
+def _is_plain_safe(value: Any) -> bool:
+    return (
+        isinstance(value, str)
+        and _PLAIN_SAFE_RE.fullmatch(value) is not None
+        and value.lower() not in _PLAIN_RESERVED
+    )
 
-    if not enabled:
-        return {"enabled": False}
 
-    start_t: time = cleaned_data[f"{prefix}_start"]
-    end_t: time = cleaned_data[f"{prefix}_end"]
+def _build_calendar(cleaned_data: Mapping[str, Any], calendar_start: date) -> Dict[str, Any]:
+    end_date: date = cleaned_data["calendar_end"]
 
     return {
-        "enabled": True,
-        "hours": {
-            "start": QuotedString(_fmt_time(start_t)),
-            "end": QuotedString(_fmt_time(end_t)),
-        },
+        "start": QuotedString(calendar_start.isoformat()),
+        "end": QuotedString(end_date.isoformat()),
+        "timezone": "UTC",
     }
 
 
+def _build_work_blocks(cleaned_data: Mapping[str, Any]) -> Dict[str, Any]:
+    get = cleaned_data.get
+    blocks: Dict[str, Any] = {}
+
+    for prefix in _WORK_BLOCKS:
+        if not get(f"{prefix}_enabled"):
+            blocks[prefix] = _DISABLED
+            continue
+
+        start_t: time = cleaned_data[f"{prefix}_start"]
+        end_t: time = cleaned_data[f"{prefix}_end"]
+
+        blocks[prefix] = {
+            "enabled": True,
+            "hours": {
+                "start": QuotedString(_fmt_time(start_t)),
+                "end": QuotedString(_fmt_time(end_t)),
+            },
+        }
+
+    return blocks
+
+
 def _build_randomness(cleaned_data: Mapping[str, Any], calendar_start: date) -> Dict[str, Any]:
-    seed = cleaned_data.get("randomness_seed")
+    # A bound form's cleaned_data holds every field, so one itemgetter call fetches
+    # them all; partial mappings fall back to .get with None for missing keys.
+    try:
+        seed, gap_min, gap_max, sec_min, sec_max = _get_randomness(cleaned_data)
+    except KeyError:
+        get = cleaned_data.get
+        seed, gap_min, gap_max, sec_min, sec_max = (get(k) for k in _RANDOMNESS_KEYS)
+
     if seed is None:
         seed = int(calendar_start.strftime("%Y%m%d"))
 
-    gap_min = cleaned_data.get("gap_minutes_min")
-    gap_max = cleaned_data.get("gap_minutes_max")
     gap_min_i, gap_max_i = _normalise_range(
         gap_min,
         gap_max,
@@ -119,8 +281,6 @@ def _build_randomness(cleaned_data: Mapping[str, Any], calendar_start: date) ->
         clamp_max=None,
     )
 
-    sec_min = cleaned_data.get("seconds_min")
-    sec_max = cleaned_data.get("seconds_max")
     sec_min_i, sec_max_i = _normalise_range(
         sec_min,
         sec_max,